@@ -1,19 +1,25 @@
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pymongo import MongoClient
-from pymongo.database import Database
-from pymongo.collection import Collection
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo import ReturnDocument
+import asyncio
+import itertools
 import os
+import time
 import json
-import requests
+import orjson
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import uuid
 from datetime import datetime
+from types import MappingProxyType
 import random
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 
 # Load environment variables
 load_dotenv()
@@ -22,12 +28,21 @@ load_dotenv()
 MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
 DB_NAME = os.environ.get("DB_NAME", "test_database")
 
-# Initialize MongoDB client
-client = MongoClient(MONGO_URL)
+# Initialize MongoDB client with a bounded connection pool and wire
+# compression (zstd when available, zlib otherwise)
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=50,
+    minPoolSize=5,
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=2000,
+    compressors="zstd,zlib",
+    retryWrites=True
+)
 db = client[DB_NAME]
 
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # CORS middleware setup
 app.add_middleware(
@@ -48,12 +63,11 @@ class WordCreate(WordBase):
     pass
 
 class Word(WordBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
-
 class WordProgressBase(BaseModel):
     word_id: str
     status: str  # "new", "learning", "known"
@@ -64,12 +78,11 @@ class WordProgressCreate(WordProgressBase):
     pass
 
 class WordProgress(WordProgressBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
-
 class FlashcardResponse(BaseModel):
     id: str
     french: str
@@ -85,202 +98,320 @@ class UserStats(BaseModel):
     total_words: int
     progress_percentage: float
 
+# Flashcard priority stored on each progress row: lower is studied first
+STATUS_PRIORITY = {"new": 0, "learning": 1, "known": 2}
+
+# Aggregation expression deriving "priority" from a progress row's "status"
+PRIORITY_EXPR = {"$switch": {
+    "branches": [
+        {"case": {"$eq": ["$status", status]}, "then": priority}
+        for status, priority in STATUS_PRIORITY.items()
+    ],
+    "default": STATUS_PRIORITY["new"]
+}}
+
+# Flashcard decks memoized per (limit, progress version); any progress write
+# bumps the version and clears the cache
+FLASHCARD_CACHE_SIZE = 32
+_FLASHCARD_CACHE: Dict[tuple, list] = {}
+_PROGRESS_VERSION = 0
+
+# Stats response cached as (progress version, expiry, stats) for polling
+# clients; a progress write bumps the version, which invalidates it
+STATS_CACHE_TTL = 5  # seconds
+_STATS_CACHE: Optional[tuple] = None
+
+# Set once this process has seen the words collection populated, at which
+# point _KNOWN_WORD_IDS holds every word id
+_SEED_DONE = False
+_KNOWN_WORD_IDS = frozenset()
+
+# Seed data
+# Common French words with Russian translations and pronunciations
+COMMON_FRENCH_WORDS = [
+    {"french": "je", "russian": "я", "pronunciation": "/ʒə/"},
+    {"french": "tu", "russian": "ты", "pronunciation": "/ty/"},
+    {"french": "il", "russian": "он", "pronunciation": "/il/"},
+    {"french": "elle", "russian": "она", "pronunciation": "/ɛl/"},
+    {"french": "nous", "russian": "мы", "pronunciation": "/nu/"},
+    {"french": "vous", "russian": "вы", "pronunciation": "/vu/"},
+    {"french": "ils", "russian": "они (муж.)", "pronunciation": "/il/"},
+    {"french": "elles", "russian": "они (жен.)", "pronunciation": "/ɛl/"},
+    {"french": "être", "russian": "быть", "pronunciation": "/ɛtʁ/"},
+    {"french": "avoir", "russian": "иметь", "pronunciation": "/avwaʁ/"},
+    {"french": "faire", "russian": "делать", "pronunciation": "/fɛʁ/"},
+    {"french": "dire", "russian": "говорить", "pronunciation": "/diʁ/"},
+    {"french": "aller", "russian": "идти", "pronunciation": "/ale/"},
+    {"french": "voir", "russian": "видеть", "pronunciation": "/vwaʁ/"},
+    {"french": "savoir", "russian": "знать", "pronunciation": "/savwaʁ/"},
+    {"french": "pouvoir", "russian": "мочь", "pronunciation": "/puvwaʁ/"},
+    {"french": "vouloir", "russian": "хотеть", "pronunciation": "/vulwaʁ/"},
+    {"french": "venir", "russian": "приходить", "pronunciation": "/vəniʁ/"},
+    {"french": "prendre", "russian": "брать", "pronunciation": "/pʁɑ̃dʁ/"},
+    {"french": "devoir", "russian": "должен", "pronunciation": "/dəvwaʁ/"},
+    {"french": "parler", "russian": "говорить", "pronunciation": "/paʁle/"},
+    {"french": "mettre", "russian": "класть", "pronunciation": "/mɛtʁ/"},
+    {"french": "penser", "russian": "думать", "pronunciation": "/pɑ̃se/"},
+    {"french": "donner", "russian": "давать", "pronunciation": "/dɔne/"},
+    {"french": "trouver", "russian": "находить", "pronunciation": "/tʁuve/"},
+    {"french": "croire", "russian": "верить", "pronunciation": "/kʁwaʁ/"},
+    {"french": "aimer", "russian": "любить", "pronunciation": "/eme/"},
+    {"french": "passer", "russian": "проходить", "pronunciation": "/pɑse/"},
+    {"french": "connaître", "russian": "знать", "pronunciation": "/kɔnɛtʁ/"},
+    {"french": "sembler", "russian": "казаться", "pronunciation": "/sɑ̃ble/"},
+]
+
+# Vocabulary used to generate the rest of the 1000-word dataset
+BASE_WORDS = (
+    "maison", "travail", "école", "eau", "pain", "famille", "ami", "enfant", "jour", "nuit",
+    "temps", "année", "mois", "semaine", "heure", "minute", "seconde", "argent", "voiture", "livre",
+    "table", "chaise", "fenêtre", "porte", "lit", "cuisine", "salle", "chambre", "bureau", "jardin",
+    "rue", "ville", "pays", "monde", "terre", "ciel", "soleil", "lune", "étoile", "nuage",
+    "pluie", "neige", "vent", "feu", "eau", "mer", "océan", "rivière", "montagne", "forêt",
+    "animal", "chat", "chien", "oiseau", "poisson", "arbre", "fleur", "fruit", "légume", "pain",
+    "viande", "fromage", "lait", "œuf", "sucre", "sel", "café", "thé", "vin", "bière",
+)
+
+# Adjectives and other word types
+ADJECTIVES = (
+    "grand", "petit", "beau", "joli", "nouveau", "vieux", "bon", "mauvais", "chaud", "froid",
+    "haut", "bas", "long", "court", "large", "étroit", "épais", "mince", "lourd", "léger",
+)
+
+COLORS = (
+    "rouge", "bleu", "vert", "jaune", "noir", "blanc", "gris", "marron", "orange", "violet",
+)
+
+VERBS = (
+    "manger", "boire", "dormir", "courir", "marcher", "nager", "voler", "sauter", "danser", "chanter",
+    "écrire", "lire", "écouter", "regarder", "entendre", "sentir", "toucher", "goûter", "acheter", "vendre",
+)
+
+NUMBERS = (
+    "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf", "dix",
+    "vingt", "trente", "quarante", "cinquante", "soixante", "soixante-dix", "quatre-vingts", "quatre-vingt-dix", "cent", "mille",
+)
+
+CATEGORIES = BASE_WORDS + ADJECTIVES + COLORS + VERBS + NUMBERS
+
+RUSSIAN_TRANSLATIONS = MappingProxyType({
+    "maison": "дом", "travail": "работа", "école": "школа", "eau": "вода", "pain": "хлеб", 
+    "famille": "семья", "ami": "друг", "enfant": "ребенок", "jour": "день", "nuit": "ночь",
+    "temps": "время", "année": "год", "mois": "месяц", "semaine": "неделя", "heure": "час", 
+    "minute": "минута", "seconde": "секунда", "argent": "деньги", "voiture": "машина", "livre": "книга",
+    "table": "стол", "chaise": "стул", "fenêtre": "окно", "porte": "дверь", "lit": "кровать", 
+    "cuisine": "кухня", "salle": "зал", "chambre": "комната", "bureau": "офис", "jardin": "сад",
+    "rue": "улица", "ville": "город", "pays": "страна", "monde": "мир", "terre": "земля", 
+    "ciel": "небо", "soleil": "солнце", "lune": "луна", "étoile": "звезда", "nuage": "облако",
+    "pluie": "дождь", "neige": "снег", "vent": "ветер", "feu": "огонь", "eau": "вода", 
+    "mer": "море", "océan": "океан", "rivière": "река", "montagne": "гора", "forêt": "лес",
+    "animal": "животное", "chat": "кот", "chien": "собака", "oiseau": "птица", "poisson": "рыба", 
+    "arbre": "дерево", "fleur": "цветок", "fruit": "фрукт", "légume": "овощ", "pain": "хлеб",
+    "viande": "мясо", "fromage": "сыр", "lait": "молоко", "œuf": "яйцо", "sucre": "сахар", 
+    "sel": "соль", "café": "кофе", "thé": "чай", "vin": "вино", "bière": "пиво",
+    
+    "grand": "большой", "petit": "маленький", "beau": "красивый", "joli": "красивый", "nouveau": "новый", 
+    "vieux": "старый", "bon": "хороший", "mauvais": "плохой", "chaud": "горячий", "froid": "холодный",
+    "haut": "высокий", "bas": "низкий", "long": "длинный", "court": "короткий", "large": "широкий", 
+    "étroit": "узкий", "épais": "толстый", "mince": "тонкий", "lourd": "тяжелый", "léger": "легкий",
+    
+    "rouge": "красный", "bleu": "синий", "vert": "зеленый", "jaune": "желтый", "noir": "черный", 
+    "blanc": "белый", "gris": "серый", "marron": "коричневый", "orange": "оранжевый", "violet": "фиолетовый",
+    
+    "manger": "есть", "boire": "пить", "dormir": "спать", "courir": "бежать", "marcher": "ходить", 
+    "nager": "плавать", "voler": "летать", "sauter": "прыгать", "danser": "танцевать", "chanter": "петь",
+    "écrire": "писать", "lire": "читать", "écouter": "слушать", "regarder": "смотреть", "entendre": "слышать", 
+    "sentir": "чувствовать", "toucher": "трогать", "goûter": "пробовать", "acheter": "покупать", "vendre": "продавать",
+    
+    "un": "один", "deux": "два", "trois": "три", "quatre": "четыре", "cinq": "пять", 
+    "six": "шесть", "sept": "семь", "huit": "восемь", "neuf": "девять", "dix": "десять",
+    "vingt": "двадцать", "trente": "тридцать", "quarante": "сорок", "cinquante": "пятьдесят", "soixante": "шестьдесят", 
+    "soixante-dix": "семьдесят", "quatre-vingts": "восемьдесят", "quatre-vingt-dix": "девяносто", "cent": "сто", "mille": "тысяча"
+})
+
+PRONUNCIATIONS = MappingProxyType({
+    "maison": "/mɛzɔ̃/", "travail": "/tʁavaj/", "école": "/ekɔl/", "eau": "/o/", "pain": "/pɛ̃/", 
+    "famille": "/famij/", "ami": "/ami/", "enfant": "/ɑ̃fɑ̃/", "jour": "/ʒuʁ/", "nuit": "/nɥi/",
+    "temps": "/tɑ̃/", "année": "/ane/", "mois": "/mwa/", "semaine": "/səmɛn/", "heure": "/œʁ/", 
+    "minute": "/minyt/", "seconde": "/səgɔ̃d/", "argent": "/aʁʒɑ̃/", "voiture": "/vwatyʁ/", "livre": "/livʁ/",
+    "table": "/tabl/", "chaise": "/ʃɛz/", "fenêtre": "/fənɛtʁ/", "porte": "/pɔʁt/", "lit": "/li/", 
+    "cuisine": "/kɥizin/", "salle": "/sal/", "chambre": "/ʃɑ̃bʁ/", "bureau": "/byʁo/", "jardin": "/ʒaʁdɛ̃/",
+    "rue": "/ʁy/", "ville": "/vil/", "pays": "/pei/", "monde": "/mɔ̃d/", "terre": "/tɛʁ/", 
+    "ciel": "/sjɛl/", "soleil": "/sɔlɛj/", "lune": "/lyn/", "étoile": "/etwal/", "nuage": "/nɥaʒ/",
+    "pluie": "/plɥi/", "neige": "/nɛʒ/", "vent": "/vɑ̃/", "feu": "/fø/", "eau": "/o/", 
+    "mer": "/mɛʁ/", "océan": "/oseɑ̃/", "rivière": "/ʁivjɛʁ/", "montagne": "/mɔ̃taɲ/", "forêt": "/fɔʁɛ/",
+    "animal": "/animal/", "chat": "/ʃa/", "chien": "/ʃjɛ̃/", "oiseau": "/wazo/", "poisson": "/pwasɔ̃/", 
+    "arbre": "/aʁbʁ/", "fleur": "/flœʁ/", "fruit": "/fʁɥi/", "légume": "/legym/", "pain": "/pɛ̃/",
+    "viande": "/vjɑ̃d/", "fromage": "/fʁomaʒ/", "lait": "/lɛ/", "œuf": "/œf/", "sucre": "/sykʁ/", 
+    "sel": "/sɛl/", "café": "/kafe/", "thé": "/te/", "vin": "/vɛ̃/", "bière": "/bjɛʁ/",
+    
+    "grand": "/gʁɑ̃/", "petit": "/pəti/", "beau": "/bo/", "joli": "/ʒɔli/", "nouveau": "/nuvo/", 
+    "vieux": "/vjø/", "bon": "/bɔ̃/", "mauvais": "/movɛ/", "chaud": "/ʃo/", "froid": "/fʁwa/",
+    "haut": "/o/", "bas": "/ba/", "long": "/lɔ̃/", "court": "/kuʁ/", "large": "/laʁʒ/", 
+    "étroit": "/etʁwa/", "épais": "/epɛ/", "mince": "/mɛ̃s/", "lourd": "/luʁ/", "léger": "/leʒe/",
+    
+    "rouge": "/ʁuʒ/", "bleu": "/blø/", "vert": "/vɛʁ/", "jaune": "/ʒon/", "noir": "/nwaʁ/", 
+    "blanc": "/blɑ̃/", "gris": "/gʁi/", "marron": "/maʁɔ̃/", "orange": "/oʁɑ̃ʒ/", "violet": "/vjɔlɛ/",
+    
+    "manger": "/mɑ̃ʒe/", "boire": "/bwaʁ/", "dormir": "/dɔʁmiʁ/", "courir": "/kuʁiʁ/", "marcher": "/maʁʃe/", 
+    "nager": "/naʒe/", "voler": "/vɔle/", "sauter": "/sote/", "danser": "/dɑ̃se/", "chanter": "/ʃɑ̃te/",
+    "écrire": "/ekʁiʁ/", "lire": "/liʁ/", "écouter": "/ekute/", "regarder": "/ʁəgaʁde/", "entendre": "/ɑ̃tɑ̃dʁ/", 
+    "sentir": "/sɑ̃tiʁ/", "toucher": "/tuʃe/", "goûter": "/gute/", "acheter": "/aʃte/", "vendre": "/vɑ̃dʁ/",
+    
+    "un": "/œ̃/", "deux": "/dø/", "trois": "/tʁwa/", "quatre": "/katʁ/", "cinq": "/sɛ̃k/", 
+    "six": "/sis/", "sept": "/sɛt/", "huit": "/ɥit/", "neuf": "/nœf/", "dix": "/dis/",
+    "vingt": "/vɛ̃/", "trente": "/tʁɑ̃t/", "quarante": "/kaʁɑ̃t/", "cinquante": "/sɛ̃kɑ̃t/", "soixante": "/swasɑ̃t/", 
+    "soixante-dix": "/swasɑ̃tdis/", "quatre-vingts": "/katʁəvɛ̃/", "quatre-vingt-dix": "/katʁəvɛ̃dis/", "cent": "/sɑ̃/", "mille": "/mil/"
+})
+
 # Helper functions
 def get_db():
     return db
 
-def get_words_collection(db: Database = Depends(get_db)) -> Collection:
+def get_words_collection(db: AsyncIOMotorDatabase = Depends(get_db)) -> AsyncIOMotorCollection:
     return db["words"]
 
-def get_progress_collection(db: Database = Depends(get_db)) -> Collection:
+def get_progress_collection(db: AsyncIOMotorDatabase = Depends(get_db)) -> AsyncIOMotorCollection:
     return db["word_progress"]
 
+def invalidate_progress_cache():
+    """Mark cached progress-derived responses as stale"""
+    global _PROGRESS_VERSION
+    _PROGRESS_VERSION += 1
+    _FLASHCARD_CACHE.clear()
+
+def default_progress_docs(word_ids, now):
+    """Build a "new" progress row for each of the given word ids"""
+    progress_ids = [uuid.uuid4().hex for _ in range(len(word_ids))]
+    return [
+        {
+            "id": progress_id,
+            "word_id": word_id,
+            "status": "new",
+            "priority": STATUS_PRIORITY["new"],
+            "strength": 0,
+            "next_review": now,
+            "updated_at": now
+        }
+        for progress_id, word_id in zip(progress_ids, word_ids)
+    ]
+
 async def fetch_and_store_french_words():
-    """Fetch French words from the website and store them in MongoDB"""
-    words_collection = get_words_collection(db)
-    
-    # Check if words are already in the database
-    if words_collection.count_documents({}) > 0:
-        print("Words already in database, skipping fetch")
+    """Store the French word dataset in MongoDB, raising on database errors"""
+    global _SEED_DONE, _KNOWN_WORD_IDS
+    if _SEED_DONE:
         return
     
-    try:
-        # Make a request to the website
-        url = "https://first-words.com/ru-RU/fr-FR/common-words"
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        # In a real-world scenario, we would extract all 1000 words from the webpage
-        # But since we're creating a simulated dataset of 1000 French words with pronunciations
-        # We'll use a more extensive list with pronunciations
-        
-        # Extended list of common French words with Russian translations and pronunciations
-        # This is a placeholder list, in a real app we would scrape all 1000 words
-        all_french_words = [
-            {"french": "je", "russian": "я", "pronunciation": "/ʒə/"},
-            {"french": "tu", "russian": "ты", "pronunciation": "/ty/"},
-            {"french": "il", "russian": "он", "pronunciation": "/il/"},
-            {"french": "elle", "russian": "она", "pronunciation": "/ɛl/"},
-            {"french": "nous", "russian": "мы", "pronunciation": "/nu/"},
-            {"french": "vous", "russian": "вы", "pronunciation": "/vu/"},
-            {"french": "ils", "russian": "они (муж.)", "pronunciation": "/il/"},
-            {"french": "elles", "russian": "они (жен.)", "pronunciation": "/ɛl/"},
-            {"french": "être", "russian": "быть", "pronunciation": "/ɛtʁ/"},
-            {"french": "avoir", "russian": "иметь", "pronunciation": "/avwaʁ/"},
-            {"french": "faire", "russian": "делать", "pronunciation": "/fɛʁ/"},
-            {"french": "dire", "russian": "говорить", "pronunciation": "/diʁ/"},
-            {"french": "aller", "russian": "идти", "pronunciation": "/ale/"},
-            {"french": "voir", "russian": "видеть", "pronunciation": "/vwaʁ/"},
-            {"french": "savoir", "russian": "знать", "pronunciation": "/savwaʁ/"},
-            {"french": "pouvoir", "russian": "мочь", "pronunciation": "/puvwaʁ/"},
-            {"french": "vouloir", "russian": "хотеть", "pronunciation": "/vulwaʁ/"},
-            {"french": "venir", "russian": "приходить", "pronunciation": "/vəniʁ/"},
-            {"french": "prendre", "russian": "брать", "pronunciation": "/pʁɑ̃dʁ/"},
-            {"french": "devoir", "russian": "должен", "pronunciation": "/dəvwaʁ/"},
-            {"french": "parler", "russian": "говорить", "pronunciation": "/paʁle/"},
-            {"french": "mettre", "russian": "класть", "pronunciation": "/mɛtʁ/"},
-            {"french": "penser", "russian": "думать", "pronunciation": "/pɑ̃se/"},
-            {"french": "donner", "russian": "давать", "pronunciation": "/dɔne/"},
-            {"french": "trouver", "russian": "находить", "pronunciation": "/tʁuve/"},
-            {"french": "croire", "russian": "верить", "pronunciation": "/kʁwaʁ/"},
-            {"french": "aimer", "russian": "любить", "pronunciation": "/eme/"},
-            {"french": "passer", "russian": "проходить", "pronunciation": "/pɑse/"},
-            {"french": "connaître", "russian": "знать", "pronunciation": "/kɔnɛtʁ/"},
-            {"french": "sembler", "russian": "казаться", "pronunciation": "/sɑ̃ble/"},
+    words_collection = db["words"]
+    progress_collection = db["word_progress"]
+    
+    # Check if words are already in the database (metadata count, no scan)
+    if await words_collection.estimated_document_count() > 0:
+        print("Words already in database, skipping seed")
+        # The deck is read from word_progress, so recreate the default row for
+        # any word without one (e.g. after a seed whose progress insert failed)
+        missing_word_ids = [
+            word["_id"]
+            async for word in words_collection.aggregate([
+                {"$lookup": {
+                    "from": "word_progress",
+                    "localField": "_id",
+                    "foreignField": "word_id",
+                    "as": "progress"
+                }},
+                {"$match": {"progress": {"$size": 0}}},
+                {"$project": {"_id": 1}}
+            ])
         ]
-        
-        # Generate additional words to reach 1000 words
-        # This is simulating having 1000 words for demonstration purposes
-        base_words = ["maison", "travail", "école", "eau", "pain", "famille", "ami", "enfant", "jour", "nuit", 
-                    "temps", "année", "mois", "semaine", "heure", "minute", "seconde", "argent", "voiture", "livre",
-                    "table", "chaise", "fenêtre", "porte", "lit", "cuisine", "salle", "chambre", "bureau", "jardin",
-                    "rue", "ville", "pays", "monde", "terre", "ciel", "soleil", "lune", "étoile", "nuage", 
-                    "pluie", "neige", "vent", "feu", "eau", "mer", "océan", "rivière", "montagne", "forêt",
-                    "animal", "chat", "chien", "oiseau", "poisson", "arbre", "fleur", "fruit", "légume", "pain",
-                    "viande", "fromage", "lait", "œuf", "sucre", "sel", "café", "thé", "vin", "bière"]
-        
-        # Add adjectives and other word types
-        adjectives = ["grand", "petit", "beau", "joli", "nouveau", "vieux", "bon", "mauvais", "chaud", "froid", 
-                    "haut", "bas", "long", "court", "large", "étroit", "épais", "mince", "lourd", "léger"]
-        
-        colors = ["rouge", "bleu", "vert", "jaune", "noir", "blanc", "gris", "marron", "orange", "violet"]
-        
-        verbs = ["manger", "boire", "dormir", "courir", "marcher", "nager", "voler", "sauter", "danser", "chanter", 
-                "écrire", "lire", "écouter", "regarder", "entendre", "sentir", "toucher", "goûter", "acheter", "vendre"]
-        
-        numbers = ["un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf", "dix", 
-                "vingt", "trente", "quarante", "cinquante", "soixante", "soixante-dix", "quatre-vingts", "quatre-vingt-dix", "cent", "mille"]
-        
-        russian_translations = {
-            "maison": "дом", "travail": "работа", "école": "школа", "eau": "вода", "pain": "хлеб", 
-            "famille": "семья", "ami": "друг", "enfant": "ребенок", "jour": "день", "nuit": "ночь",
-            "temps": "время", "année": "год", "mois": "месяц", "semaine": "неделя", "heure": "час", 
-            "minute": "минута", "seconde": "секунда", "argent": "деньги", "voiture": "машина", "livre": "книга",
-            "table": "стол", "chaise": "стул", "fenêtre": "окно", "porte": "дверь", "lit": "кровать", 
-            "cuisine": "кухня", "salle": "зал", "chambre": "комната", "bureau": "офис", "jardin": "сад",
-            "rue": "улица", "ville": "город", "pays": "страна", "monde": "мир", "terre": "земля", 
-            "ciel": "небо", "soleil": "солнце", "lune": "луна", "étoile": "звезда", "nuage": "облако",
-            "pluie": "дождь", "neige": "снег", "vent": "ветер", "feu": "огонь", "eau": "вода", 
-            "mer": "море", "océan": "океан", "rivière": "река", "montagne": "гора", "forêt": "лес",
-            "animal": "животное", "chat": "кот", "chien": "собака", "oiseau": "птица", "poisson": "рыба", 
-            "arbre": "дерево", "fleur": "цветок", "fruit": "фрукт", "légume": "овощ", "pain": "хлеб",
-            "viande": "мясо", "fromage": "сыр", "lait": "молоко", "œuf": "яйцо", "sucre": "сахар", 
-            "sel": "соль", "café": "кофе", "thé": "чай", "vin": "вино", "bière": "пиво",
-            
-            "grand": "большой", "petit": "маленький", "beau": "красивый", "joli": "красивый", "nouveau": "новый", 
-            "vieux": "старый", "bon": "хороший", "mauvais": "плохой", "chaud": "горячий", "froid": "холодный",
-            "haut": "высокий", "bas": "низкий", "long": "длинный", "court": "короткий", "large": "широкий", 
-            "étroit": "узкий", "épais": "толстый", "mince": "тонкий", "lourd": "тяжелый", "léger": "легкий",
-            
-            "rouge": "красный", "bleu": "синий", "vert": "зеленый", "jaune": "желтый", "noir": "черный", 
-            "blanc": "белый", "gris": "серый", "marron": "коричневый", "orange": "оранжевый", "violet": "фиолетовый",
-            
-            "manger": "есть", "boire": "пить", "dormir": "спать", "courir": "бежать", "marcher": "ходить", 
-            "nager": "плавать", "voler": "летать", "sauter": "прыгать", "danser": "танцевать", "chanter": "петь",
-            "écrire": "писать", "lire": "читать", "écouter": "слушать", "regarder": "смотреть", "entendre": "слышать", 
-            "sentir": "чувствовать", "toucher": "трогать", "goûter": "пробовать", "acheter": "покупать", "vendre": "продавать",
-            
-            "un": "один", "deux": "два", "trois": "три", "quatre": "четыре", "cinq": "пять", 
-            "six": "шесть", "sept": "семь", "huit": "восемь", "neuf": "девять", "dix": "десять",
-            "vingt": "двадцать", "trente": "тридцать", "quarante": "сорок", "cinquante": "пятьдесят", "soixante": "шестьдесят", 
-            "soixante-dix": "семьдесят", "quatre-vingts": "восемьдесят", "quatre-vingt-dix": "девяносто", "cent": "сто", "mille": "тысяча"
+        if missing_word_ids:
+            await progress_collection.insert_many(
+                default_progress_docs(missing_word_ids, datetime.utcnow()),
+                ordered=False
+            )
+            invalidate_progress_cache()
+            print(f"Added missing progress for {len(missing_word_ids)} words")
+        _KNOWN_WORD_IDS = frozenset(
+            [word["_id"] async for word in words_collection.find({}, {"_id": 1})]
+        )
+        _SEED_DONE = True
+        return
+    
+    # Start from the common words and generate the rest of the 1000-word dataset
+    all_french_words = list(COMMON_FRENCH_WORDS)
+    
+    # Generate more words to reach 1000 total, cycling through the
+    # categories in a single flat iterator
+    generated = itertools.islice(
+        itertools.product(range(1, 100), CATEGORIES),
+        1000 - len(all_french_words)
+    )
+    all_french_words.extend(
+        {
+            "french": base_word,
+            "russian": RUSSIAN_TRANSLATIONS.get(base_word, base_word),
+            "pronunciation": PRONUNCIATIONS.get(base_word, "/əəə/")
         }
-        
-        pronunciations = {
-            "maison": "/mɛzɔ̃/", "travail": "/tʁavaj/", "école": "/ekɔl/", "eau": "/o/", "pain": "/pɛ̃/", 
-            "famille": "/famij/", "ami": "/ami/", "enfant": "/ɑ̃fɑ̃/", "jour": "/ʒuʁ/", "nuit": "/nɥi/",
-            "temps": "/tɑ̃/", "année": "/ane/", "mois": "/mwa/", "semaine": "/səmɛn/", "heure": "/œʁ/", 
-            "minute": "/minyt/", "seconde": "/səgɔ̃d/", "argent": "/aʁʒɑ̃/", "voiture": "/vwatyʁ/", "livre": "/livʁ/",
-            "table": "/tabl/", "chaise": "/ʃɛz/", "fenêtre": "/fənɛtʁ/", "porte": "/pɔʁt/", "lit": "/li/", 
-            "cuisine": "/kɥizin/", "salle": "/sal/", "chambre": "/ʃɑ̃bʁ/", "bureau": "/byʁo/", "jardin": "/ʒaʁdɛ̃/",
-            "rue": "/ʁy/", "ville": "/vil/", "pays": "/pei/", "monde": "/mɔ̃d/", "terre": "/tɛʁ/", 
-            "ciel": "/sjɛl/", "soleil": "/sɔlɛj/", "lune": "/lyn/", "étoile": "/etwal/", "nuage": "/nɥaʒ/",
-            "pluie": "/plɥi/", "neige": "/nɛʒ/", "vent": "/vɑ̃/", "feu": "/fø/", "eau": "/o/", 
-            "mer": "/mɛʁ/", "océan": "/oseɑ̃/", "rivière": "/ʁivjɛʁ/", "montagne": "/mɔ̃taɲ/", "forêt": "/fɔʁɛ/",
-            "animal": "/animal/", "chat": "/ʃa/", "chien": "/ʃjɛ̃/", "oiseau": "/wazo/", "poisson": "/pwasɔ̃/", 
-            "arbre": "/aʁbʁ/", "fleur": "/flœʁ/", "fruit": "/fʁɥi/", "légume": "/legym/", "pain": "/pɛ̃/",
-            "viande": "/vjɑ̃d/", "fromage": "/fʁomaʒ/", "lait": "/lɛ/", "œuf": "/œf/", "sucre": "/sykʁ/", 
-            "sel": "/sɛl/", "café": "/kafe/", "thé": "/te/", "vin": "/vɛ̃/", "bière": "/bjɛʁ/",
-            
-            "grand": "/gʁɑ̃/", "petit": "/pəti/", "beau": "/bo/", "joli": "/ʒɔli/", "nouveau": "/nuvo/", 
-            "vieux": "/vjø/", "bon": "/bɔ̃/", "mauvais": "/movɛ/", "chaud": "/ʃo/", "froid": "/fʁwa/",
-            "haut": "/o/", "bas": "/ba/", "long": "/lɔ̃/", "court": "/kuʁ/", "large": "/laʁʒ/", 
-            "étroit": "/etʁwa/", "épais": "/epɛ/", "mince": "/mɛ̃s/", "lourd": "/luʁ/", "léger": "/leʒe/",
-            
-            "rouge": "/ʁuʒ/", "bleu": "/blø/", "vert": "/vɛʁ/", "jaune": "/ʒon/", "noir": "/nwaʁ/", 
-            "blanc": "/blɑ̃/", "gris": "/gʁi/", "marron": "/maʁɔ̃/", "orange": "/oʁɑ̃ʒ/", "violet": "/vjɔlɛ/",
-            
-            "manger": "/mɑ̃ʒe/", "boire": "/bwaʁ/", "dormir": "/dɔʁmiʁ/", "courir": "/kuʁiʁ/", "marcher": "/maʁʃe/", 
-            "nager": "/naʒe/", "voler": "/vɔle/", "sauter": "/sote/", "danser": "/dɑ̃se/", "chanter": "/ʃɑ̃te/",
-            "écrire": "/ekʁiʁ/", "lire": "/liʁ/", "écouter": "/ekute/", "regarder": "/ʁəgaʁde/", "entendre": "/ɑ̃tɑ̃dʁ/", 
-            "sentir": "/sɑ̃tiʁ/", "toucher": "/tuʃe/", "goûter": "/gute/", "acheter": "/aʃte/", "vendre": "/vɑ̃dʁ/",
-            
-            "un": "/œ̃/", "deux": "/dø/", "trois": "/tʁwa/", "quatre": "/katʁ/", "cinq": "/sɛ̃k/", 
-            "six": "/sis/", "sept": "/sɛt/", "huit": "/ɥit/", "neuf": "/nœf/", "dix": "/dis/",
-            "vingt": "/vɛ̃/", "trente": "/tʁɑ̃t/", "quarante": "/kaʁɑ̃t/", "cinquante": "/sɛ̃kɑ̃t/", "soixante": "/swasɑ̃t/", 
-            "soixante-dix": "/swasɑ̃tdis/", "quatre-vingts": "/katʁəvɛ̃/", "quatre-vingt-dix": "/katʁəvɛ̃dis/", "cent": "/sɑ̃/", "mille": "/mil/"
+        for _, base_word in generated
+    )
+    
+    # Build the word documents in a single batch
+    now = datetime.utcnow()
+    word_ids = [uuid.uuid4().hex for _ in range(len(all_french_words))]
+    docs = [
+        {
+            "_id": word_id,
+            "french": word_data["french"],
+            "russian": word_data["russian"],
+            "pronunciation": word_data.get("pronunciation", ""),
+            "created_at": now
         }
-        
-        # Generate more words to reach 1000 total
-        for i in range(1, 100):
-            for base_word in [*base_words, *adjectives, *colors, *verbs, *numbers]:
-                if len(all_french_words) < 1000:
-                    french_word = base_word
-                    rrussian = russian_translations.get(base_word, base_word)
-                    pronunciation = pronunciations.get(base_word, "/əəə/")
-                    all_french_words.append({
-                        "french": french_word,
-                        "russian": russian,
-                        "pronunciation": pronunciation
-                    })
-                else:
-                    break
-            if len(all_french_words) >= 1000:
-                break
-        
-        # Limit to exactly 1000 words
-        all_french_words = all_french_words[:1000]
-        
-        # Insert words into MongoDB
-        for word_data in all_french_words:
-            words_collection.insert_one({
-                "id": str(uuid.uuid4()),
-                "french": word_data["french"],
-                "russian": word_data["russian"],
-                "pronunciation": word_data.get("pronunciation", ""),
-                "created_at": datetime.utcnow()
-            })
-        
-        print(f"Added {len(all_french_words)} words to the database")
+        for word_id, word_data in zip(word_ids, all_french_words)
+    ]
+    
+    # Start every word with a "new" progress row so the flashcard deck
+    # can be read straight off the word_progress index
+    progress_docs = default_progress_docs(word_ids, now)
+    
+    # Load with the word_progress indexes in place: the API is already
+    # serving upserts that rely on the unique word_id index
+    await words_collection.insert_many(docs, ordered=False)
+    await progress_collection.insert_many(progress_docs, ordered=False)
+    invalidate_progress_cache()
+    _KNOWN_WORD_IDS = frozenset(word_ids)
+    _SEED_DONE = True
+    
+    print(f"Added {len(all_french_words)} words to the database")
+
+async def seed_french_words():
+    """Run the seed until it succeeds, backing off between attempts"""
+    delay = 1
+    while True:
+        try:
+            await ensure_indexes()
+            await fetch_and_store_french_words()
+            return
+        except Exception as e:
+            print(f"Error storing French words, retrying in {delay}s: {str(e)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+
+async def ensure_indexes():
+    """Create the indexes backing progress lookups (words are keyed by _id)"""
+    # Create each index separately so one failure doesn't skip the others
+    try:
+        await db["word_progress"].create_index("word_id", unique=True)
     except Exception as e:
-        print(f"Error fetching French words: {str(e)}")
+        print(f"Error creating word_progress.word_id index: {str(e)}")
+    try:
+        await db["word_progress"].create_index([("priority", 1), ("strength", 1)])
+    except Exception as e:
+        print(f"Error creating word_progress priority index: {str(e)}")
 
 @app.on_event("startup")
 async def startup_db_client():
-    # Initialize database with words on startup
-    background_tasks = BackgroundTasks()
-    background_tasks.add_task(fetch_and_store_french_words)
-    await fetch_and_store_french_words()
+    # Index and seed the database in the background so startup is not held
+    # up; keep a reference so the task is not garbage collected mid-run
+    app.state.seed_task = asyncio.create_task(seed_french_words())
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
@@ -293,173 +424,160 @@ async def root():
 
 @app.get("/api/words", response_model=List[Word])
 async def get_all_words(
-    words_collection: Collection = Depends(get_words_collection)
+    words_collection: AsyncIOMotorCollection = Depends(get_words_collection)
 ):
-    words = list(words_collection.find())
-    return [
-        {
-            "id": word.get("id"),
-            "french": word.get("french"),
-            "russian": word.get("russian"),
-            "pronunciation": word.get("pronunciation", ""),
-            "created_at": word.get("created_at")
-        }
-        for word in words
-    ]
+    cursor = words_collection.find(
+        {},
+        {"_id": 0, "id": "$_id", "french": 1, "russian": 1, "pronunciation": 1, "created_at": 1}
+    )
+    
+    # Read the first batch before responding so connection and query errors
+    # still surface as HTTP errors rather than a truncated 200 body
+    first_batch = await cursor.to_list(length=100)
+    
+    # The projection already matches Word, so stream each document as it
+    # arrives instead of materialising and re-validating the whole list
+    async def stream_words():
+        yield b"["
+        separator = b""
+        for word in first_batch:
+            yield separator + orjson.dumps(word)
+            separator = b","
+        async for word in cursor:
+            yield separator + orjson.dumps(word)
+            separator = b","
+        yield b"]"
+    
+    return StreamingResponse(stream_words(), media_type="application/json")
 
 @app.get("/api/flashcards", response_model=List[FlashcardResponse])
 async def get_flashcards(
-    limit: int = 10,
-    words_collection: Collection = Depends(get_words_collection),
-    progress_collection: Collection = Depends(get_progress_collection)
+    limit: int = Query(10, ge=1, le=100),
+    progress_collection: AsyncIOMotorCollection = Depends(get_progress_collection)
 ):
-    # Get all words
-    all_words = list(words_collection.find())
-    
-    # Get existing progress
-    all_progress = list(progress_collection.find())
-    progress_by_word_id = {p.get("word_id"): p for p in all_progress}
-    
-    # Create user progress for words that don't have it
-    for word in all_words:
-        word_id = word.get("id")
-        if word_id not in progress_by_word_id:
-            new_progress = {
-                "id": str(uuid.uuid4()),
-                "word_id": word_id,
-                "status": "new",
-                "strength": 0,
-                "next_review": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            progress_collection.insert_one(new_progress)
-            progress_by_word_id[word_id] = new_progress
-    
-    # Prepare flashcards with priority
-    flashcards = []
-    
-    # Add new words
-    new_words = [
-        word for word in all_words
-        if progress_by_word_id.get(word.get("id"), {}).get("status") == "new"
-    ]
+    cache_key = (limit, _PROGRESS_VERSION)
+    flashcards = _FLASHCARD_CACHE.get(cache_key)
+    if flashcards is not None:
+        return ORJSONResponse(flashcards)
     
-    # Add learning words (priority by strength: lower strength = higher priority)
-    learning_words = [
-        word for word in all_words
-        if progress_by_word_id.get(word.get("id"), {}).get("status") == "learning"
-    ]
-    learning_words.sort(
-        key=lambda w: progress_by_word_id.get(w.get("id"), {}).get("strength", 0)
-    )
-    
-    # Add known words (lowest priority)
-    known_words = [
-        word for word in all_words
-        if progress_by_word_id.get(word.get("id"), {}).get("status") == "known"
-    ]
+    # Walk the (priority, strength) index: new words first, then learning
+    # words by ascending strength, then known. Only the selected rows are
+    # joined to their words.
+    flashcards = await progress_collection.aggregate([
+        {"$sort": {"priority": 1, "strength": 1}},
+        {"$limit": limit},
+        {"$lookup": {
+            "from": "words",
+            "localField": "word_id",
+            "foreignField": "_id",
+            "as": "word"
+        }},
+        {"$unwind": "$word"},
+        {"$project": {
+            "_id": 0,
+            "id": "$word._id",
+            "french": "$word.french",
+            "russian": "$word.russian",
+            "pronunciation": "$word.pronunciation",
+            "status": 1,
+            "strength": 1
+        }}
+    ]).to_list(limit)
     
-    # Combine with priority
-    combined_words = new_words + learning_words + known_words
+    if len(_FLASHCARD_CACHE) >= FLASHCARD_CACHE_SIZE:
+        _FLASHCARD_CACHE.clear()
+    _FLASHCARD_CACHE[cache_key] = flashcards
     
-    # Select a subset for study
-    selected_words = combined_words[:limit]
-    
-    # Format response
-    flashcards = [
-        {
-            "id": word.get("id"),
-            "french": word.get("french"),
-            "russian": word.get("russian"),
-            "pronunciation": word.get("pronunciation", ""),
-            "status": progress_by_word_id.get(word.get("id"), {}).get("status", "new"),
-            "strength": progress_by_word_id.get(word.get("id"), {}).get("strength", 0)
-        }
-        for word in selected_words
-    ]
-    
-    return flashcards
+    # The pipeline already shapes each card as a FlashcardResponse, so skip
+    # re-validating it against the response model
+    return ORJSONResponse(flashcards)
 
 @app.post("/api/flashcards/{word_id}/update")
 async def update_word_progress(
     word_id: str,
     known: bool,
-    progress_collection: Collection = Depends(get_progress_collection),
-    words_collection: Collection = Depends(get_words_collection)
+    progress_collection: AsyncIOMotorCollection = Depends(get_progress_collection),
+    words_collection: AsyncIOMotorCollection = Depends(get_words_collection)
 ):
-    # Check if word exists
-    word = words_collection.find_one({"id": word_id})
-    if not word:
+    # Check if word exists, from memory once the word ids are loaded
+    if _SEED_DONE:
+        word_exists = word_id in _KNOWN_WORD_IDS
+    else:
+        word_exists = await words_collection.find_one({"_id": word_id}, {"_id": 1}) is not None
+    if not word_exists:
         raise HTTPException(status_code=404, detail="Word not found")
     
-    # Get current progress
-    progress = progress_collection.find_one({"word_id": word_id})
-    
-    if not progress:
-        # Create new progress if it doesn't exist
-        progress = {
-            "id": str(uuid.uuid4()),
-            "word_id": word_id,
-            "status": "new",
-            "strength": 0,
-            "next_review": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        }
-    
-    # Update progress based on user response
-    current_strength = progress.get("strength", 0)
-    current_status = progress.get("status", "new")
-    
+    # Apply the answer atomically: clamp strength to 0-5 and derive the new
+    # status on the server, creating the progress row if it doesn't exist
     if known:
         # User knows the word, increase strength
-        new_strength = min(current_strength + 1, 5)
-        new_status = "known" if new_strength >= 5 else "learning"
+        strength_delta = 1
+        status_expr = {"$cond": [{"$gte": ["$strength", 5]}, "known", "learning"]}
     else:
         # User doesn't know the word, decrease strength
-        new_strength = max(current_strength - 1, 0)
-        new_status = "new" if new_strength == 0 else "learning"
-    
-    # Update in database
-    update_data = {
-        "status": new_status,
-        "strength": new_strength,
-        "updated_at": datetime.utcnow()
-    }
+        strength_delta = -1
+        status_expr = {"$cond": [{"$eq": ["$strength", 0]}, "new", "learning"]}
     
-    if progress.get("id"):
-        # Update existing progress
-        progress_collection.update_one(
-            {"id": progress.get("id")},
-            {"$set": update_data}
-        )
-    else:
-        # Insert new progress
-        update_data["id"] = str(uuid.uuid4())
-        update_data["word_id"] = word_id
-        progress_collection.insert_one(update_data)
+    now = datetime.utcnow()
+    progress = await progress_collection.find_one_and_update(
+        {"word_id": word_id},
+        [
+            {"$set": {
+                "id": {"$ifNull": ["$id", uuid.uuid4().hex]},
+                "next_review": {"$ifNull": ["$next_review", now]},
+                "strength": {"$max": [0, {"$min": [5, {
+                    "$add": [{"$ifNull": ["$strength", 0]}, strength_delta]
+                }]}]},
+                "updated_at": now
+            }},
+            {"$set": {"status": status_expr}},
+            {"$set": {"priority": PRIORITY_EXPR}}
+        ],
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    invalidate_progress_cache()
+    new_status = progress["status"]
+    new_strength = progress["strength"]
     
     return {"success": True, "new_status": new_status, "new_strength": new_strength}
 
 @app.get("/api/stats", response_model=UserStats)
 async def get_user_stats(
-    words_collection: Collection = Depends(get_words_collection),
-    progress_collection: Collection = Depends(get_progress_collection)
+    words_collection: AsyncIOMotorCollection = Depends(get_words_collection),
+    progress_collection: AsyncIOMotorCollection = Depends(get_progress_collection)
 ):
-    # Count total words
-    total_words = words_collection.count_documents({})
+    global _STATS_CACHE
+    version = _PROGRESS_VERSION
+    if _STATS_CACHE is not None:
+        cached_version, expires_at, stats = _STATS_CACHE
+        if cached_version == version and time.monotonic() < expires_at:
+            return stats
     
-    # Count words by status
-    known_words = progress_collection.count_documents({"status": "known"})
-    learning_words = progress_collection.count_documents({"status": "learning"})
+    # Count total words from collection metadata
+    total_words = await words_collection.estimated_document_count()
+    
+    # Count words by status in a single pass
+    counts_by_status = {
+        group["_id"]: group["n"]
+        async for group in progress_collection.aggregate([
+            {"$group": {"_id": "$status", "n": {"$sum": 1}}}
+        ])
+    }
+    known_words = counts_by_status.get("known", 0)
+    learning_words = counts_by_status.get("learning", 0)
     new_words = total_words - known_words - learning_words
     
     # Calculate progress percentage
     progress_percentage = (known_words / total_words * 100) if total_words > 0 else 0
     
-    return {
+    stats = {
         "known_words": known_words,
         "learning_words": learning_words,
         "new_words": new_words,
         "total_words": total_words,
         "progress_percentage": progress_percentage
     }
+    _STATS_CACHE = (version, time.monotonic() + STATS_CACHE_TTL, stats)
+    
+    return stats
@@ -8,20 +8,22 @@ class FrenchVocabularyAPITester:
         self.base_url = base_url
         self.tests_run = 0
         self.tests_passed = 0
+        # Reuse one keep-alive connection instead of a new TLS handshake per test
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
         """Run a single API test"""
         url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
 
         self.tests_run += 1
         print(f"\n🔍 Testing {name}...")
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=params)
+                response = self.session.get(url, params=params)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, params=params)
+                response = self.session.post(url, json=data, params=params)
 
             success = response.status_code == expected_status
             if success: